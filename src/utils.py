@@ -1,32 +1,80 @@
 import os
 import json
-import yaml
+import time
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson необязателен, используется стандартный json
+    orjson = None
+
+
 def save_json(data: Dict, filepath: str) -> None:
-    """Сохраняет данные в JSON файл"""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    """Сохраняет данные в JSON файл.
+
+    Если установлен orjson, запись идёт через него, иначе через стандартный
+    json; результат - эквивалентный JSON, но не обязательно побайтно
+    одинаковый (например, 1e-5 вместо 1e-05). orjson записывает NaN и
+    Infinity как null, стандартный json - как NaN/Infinity. Данные, которые
+    orjson не принимает (нестроковые ключи, целые вне 64 бит, datetime,
+    dataclass, циклические ссылки), записываются через стандартный json.
+    """
+    data_bytes = None
+    if orjson is not None:
+        try:
+            data_bytes = orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except orjson.JSONEncodeError:
+            pass
+    if data_bytes is None:
+        data_bytes = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    with open(filepath, 'wb') as f:
+        f.write(data_bytes)
     print(f"Данные сохранены в {filepath}")
 
 
 def load_json(filepath: str) -> Dict:
     """Загружает данные из JSON файла"""
+    # Разбор всегда через стандартный json: orjson.loads отвергает NaN и
+    # молча превращает целые вне 64 бит в float
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
+# Кэш последней отформатированной метки: [секунда эпохи, строка].
+# Обновление из двух присваиваний не атомарно: при гонке потоков метка
+# может на мгновение оказаться в паре со строкой соседней секунды. Для
+# логов это безвредно, поэтому блокировка не используется.
+_TS_CACHE = [0, ""]
+
+
 def get_timestamp() -> str:
-    """Возвращает текущую метку времени"""
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    """Возвращает текущую метку времени (форматируется не чаще раза в секунду)"""
+    s = int(time.time())
+    c = _TS_CACHE
+    if s != c[0]:
+        c[1] = datetime.fromtimestamp(s).strftime("%Y%m%d_%H%M%S")
+        c[0] = s
+    return c[1]
 
 
 class ProjectLogger:
-    """Логгер для проекта"""
+    """Логгер для проекта.
+
+    Файл лога открывается при первой записи и остаётся открытым до close().
+    Смена self.log_file учитывается при следующей записи. Если файл
+    удалён или ротирован извне, нужно вызвать close() - следующая запись
+    создаст его заново. Можно использовать как контекстный менеджер.
+    """
     
     def __init__(self, log_file: str = "project.log"):
         self.log_file = log_file
+        self._fh = None
         
     def log(self, message: str, level: str = "INFO"):
         """Записывает сообщение в лог"""
@@ -34,5 +82,26 @@ class ProjectLogger:
         log_message = f"[{timestamp}] [{level}] {message}"
         
         print(log_message)
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_message + "\n")
\ No newline at end of file
+        fh = self._fh
+        if fh is None or fh.closed or fh.name != os.fspath(self.log_file):
+            # Файл открывается при первой записи, после close() и при смене
+            # log_file; построчная буферизация передаёт каждую строку ОС
+            # без open/close на каждое сообщение
+            self.close()
+            fh = self._fh = open(self.log_file, 'a', encoding='utf-8', buffering=1)
+        fh.write(log_message + "\n")
+
+    def close(self):
+        """Закрывает файл лога"""
+        if self._fh is not None and not self._fh.closed:
+            self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, "_fh", None) is not None:
+            self.close()
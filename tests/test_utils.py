@@ -0,0 +1,154 @@
+import math
+import os
+from datetime import datetime
+
+import pytest
+
+import utils
+from utils import ProjectLogger, get_timestamp, load_json, save_json
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Прогоняет тест через orjson и через запасной путь стандартного json"""
+    if request.param == "orjson":
+        if utils.orjson is None:
+            pytest.skip("orjson не установлен")
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+    return request.param
+
+
+def test_load_json_returns_independent_objects(tmp_path):
+    path = str(tmp_path / "data.json")
+    save_json({"a": [1, 2]}, path)
+
+    first = load_json(path)
+    first["a"].append(99)
+
+    assert load_json(path) == {"a": [1, 2]}
+    assert load_json(path) is not load_json(path)
+
+
+def test_load_json_sees_rewrite_with_same_mtime(tmp_path):
+    path = str(tmp_path / "data.json")
+    save_json({"a": [1, 2]}, path)
+    st = os.stat(path)
+    assert load_json(path) == {"a": [1, 2]}
+
+    save_json({"a": [7, 7, 7]}, path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert load_json(path) == {"a": [7, 7, 7]}
+
+
+def test_save_json_keeps_non_ascii_as_utf8(tmp_path, json_backend):
+    path = tmp_path / "data.json"
+    data = {"работа": ["Монтаж", 1.5, None, True]}
+    save_json(data, str(path))
+
+    assert "Монтаж" in path.read_text(encoding="utf-8")
+    assert load_json(str(path)) == data
+
+
+def test_save_json_nan(tmp_path, json_backend):
+    path = str(tmp_path / "data.json")
+    save_json({"f": float("nan")}, path)
+
+    value = load_json(path)["f"]
+    if json_backend == "orjson":
+        assert value is None
+    else:
+        assert math.isnan(value)
+
+
+def test_save_json_big_int(tmp_path, json_backend):
+    path = str(tmp_path / "data.json")
+    save_json({"n": 2 ** 70}, path)
+
+    assert load_json(path) == {"n": 2 ** 70}
+
+
+def test_save_json_int_keys(tmp_path, json_backend):
+    path = str(tmp_path / "data.json")
+    save_json({1: "x", "b": 2}, path)
+
+    assert load_json(path) == {"1": "x", "b": 2}
+
+
+def test_save_json_circular_reference(tmp_path, json_backend):
+    data = []
+    data.append(data)
+
+    with pytest.raises(ValueError, match="Circular reference"):
+        save_json(data, str(tmp_path / "data.json"))
+
+
+def test_logger_opens_file_on_first_write(tmp_path):
+    path = tmp_path / "project.log"
+    logger = ProjectLogger(str(path))
+    assert not path.exists()
+
+    logger.log("первое")
+    logger.close()
+
+    assert path.read_text(encoding="utf-8").endswith("[INFO] первое\n")
+
+
+def test_logger_reopens_after_close(tmp_path):
+    path = tmp_path / "project.log"
+    with ProjectLogger(str(path)) as logger:
+        logger.log("a")
+        logger.close()
+        logger.log("b", "WARNING")
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [line.split("] ", 1)[1] for line in lines] == ["[INFO] a", "[WARNING] b"]
+
+
+def test_logger_appends_across_instances(tmp_path):
+    path = str(tmp_path / "project.log")
+    with ProjectLogger(path) as logger:
+        logger.log("a")
+    with ProjectLogger(path) as logger:
+        logger.log("b")
+
+    with open(path, encoding="utf-8") as f:
+        assert len(f.read().splitlines()) == 2
+
+
+def test_logger_follows_log_file_change(tmp_path):
+    first = tmp_path / "first.log"
+    second = tmp_path / "second.log"
+    with ProjectLogger(str(first)) as logger:
+        logger.log("a")
+        logger.log_file = str(second)
+        logger.log("b")
+
+    assert first.read_text(encoding="utf-8").endswith("a\n")
+    assert second.read_text(encoding="utf-8").endswith("b\n")
+
+
+def test_get_timestamp_matches_strftime():
+    before = datetime.now().strftime("%Y%m%d_%H%M%S")
+    stamp = get_timestamp()
+    after = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    assert stamp in (before, after)
+
+
+def test_get_timestamp_reformats_only_when_second_changes(monkeypatch):
+    monkeypatch.setattr(utils, "_TS_CACHE", [0, ""])
+    now = [1_700_000_000.1]
+    monkeypatch.setattr(utils.time, "time", lambda: now[0])
+
+    first = get_timestamp()
+    assert first == datetime.fromtimestamp(1_700_000_000).strftime("%Y%m%d_%H%M%S")
+
+    now[0] = 1_700_000_000.9
+    assert get_timestamp() is first
+
+    now[0] = 1_700_000_001.0
+    second = get_timestamp()
+    assert second == datetime.fromtimestamp(1_700_000_001).strftime("%Y%m%d_%H%M%S")
+    assert second != first